@@ -1,18 +1,247 @@
-"""DeepL translation provider implementation."""
+"""DeepL translation provider implementation.
+
+The translator holds pooled HTTP connections. Release them deterministically
+with ``async with DeepLTranslator(config) as translator: ...``, or by calling
+``await translator.aclose()`` (``translator.close()`` for sync-only use).
+"""
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+import sys
+import time
+from collections import deque
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import aiohttp
 import deepl
+import orjson
 from mt_providers.base import BaseTranslationProvider
 from mt_providers.exceptions import TranslationError
 from mt_providers.types import TranslationConfig, TranslationResponse
 
 logger = logging.getLogger(__name__)
 
+# Metadata shared by every successful response
+_BASE_METADATA: Dict[str, Any] = {
+    "confidence": 1.0,  # DeepL doesn't provide scores
+    "provider": "deepl",
+    "model": "deepl-api",
+}
+
+# Retries for HTTP 429 responses on the async path
+_MAX_RATE_LIMIT_RETRIES = 3
+
+
+def _freeze(table: Dict[str, str]) -> Mapping[str, str]:
+    """Return a read-only copy of a language table with interned values."""
+    return MappingProxyType({k: sys.intern(v) for k, v in table.items()})
+
+
+# DeepL language mapping, built once at import
+_DEEPL_LANG_MAP = _freeze({
+    "ar": "AR",
+    "bg": "BG",
+    "cs": "CS",
+    "da": "DA",
+    "de": "DE",
+    "el": "EL",
+    "en": "EN",
+    "en-GB": "EN-GB",
+    "en-US": "EN-US",
+    "es": "ES",
+    "es-419": "ES-419",
+    "et": "ET",
+    "fi": "FI",
+    "fr": "FR",
+    "he": "HE",
+    "hu": "HU",
+    "id": "ID",
+    "it": "IT",
+    "ja": "JA",
+    "ko": "KO",
+    "lt": "LT",
+    "lv": "LV",
+    "nb": "NB",
+    "nl": "NL",
+    "pl": "PL",
+    "pt": "PT",
+    "pt-BR": "PT-BR",
+    "pt-PT": "PT-PT",
+    "ro": "RO",
+    "ru": "RU",
+    "sk": "SK",
+    "sl": "SL",
+    "sv": "SV",
+    "th": "TH",
+    "tr": "TR",
+    "uk": "UK",
+    "vi": "VI",
+    "zh": "ZH",
+    "zh-HANS": "ZH-HANS",
+    "zh-HANT": "ZH-HANT",
+})
+
+
+def _build_lookup(table: Mapping[str, str]) -> Dict[str, str]:
+    """Index a language table by its codes, lowercase codes and DeepL codes.
+
+    Earlier spellings win, so an explicit entry always beats a derived one.
+    """
+    lookup: Dict[str, str] = {}
+    for key, code in table.items():
+        lookup.setdefault(key, code)
+    for key, code in table.items():
+        lookup.setdefault(key.lower(), code)
+        lookup.setdefault(code, code)
+    return lookup
+
+
+# Every accepted spelling of a supported code, resolved in one dict lookup
+_LANG_LOOKUP = _freeze(_build_lookup(_DEEPL_LANG_MAP))
+
+
+def _resolve_lang(lang_code: str) -> str:
+    """Map a language code to DeepL format, falling back to the root code."""
+    code = _LANG_LOOKUP.get(lang_code) or _LANG_LOOKUP.get(
+        lang_code.split('-', 1)[0].lower()
+    )
+    if code is None:
+        raise ValueError(f'Unsupported Language: {lang_code}')
+    return code
+
+
+# Lowercase forms of DeepL's codes, so detected languages reuse one string
+_DETECTED_LOWER = _freeze({
+    code: code.lower() for code in _DEEPL_LANG_MAP.values()
+})
+
+
+def _detected_language(code: Optional[str], default: str) -> str:
+    """Lowercase a detected DeepL language code, or fall back to default."""
+    if not code:
+        return default
+    return _DETECTED_LOWER.get(code) or code.lower()
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_pair(source_lang: str, target_lang: str) -> Tuple[Optional[str], str]:
+    """Resolve a (source, target) pair to DeepL codes.
+
+    Source languages are sent without regional variants; "auto" maps to None
+    so DeepL detects the source itself.
+    """
+    source_mapped = None
+    if source_lang != "auto":
+        source_mapped = _resolve_lang(source_lang.split('-', 1)[0].lower())
+    return source_mapped, _resolve_lang(target_lang)
+
+
+class _DeepLLimiter:
+    """Adaptive (AIMD) concurrency limiter for async DeepL requests.
+
+    The concurrency limit grows additively while responses come back under the
+    target latency and is halved on HTTP 429 or when latency exceeds it.
+    """
+
+    def __init__(
+        self,
+        min_concurrency: int = 2,
+        max_concurrency: int = 64,
+        target_latency: float = 5.0,
+        window: float = 60.0,
+    ) -> None:
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self.window = window
+        self.limit = float(min_concurrency)
+
+        self._in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._latencies: Deque[float] = deque(maxlen=20)
+        self._timestamps: Deque[float] = deque()
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Hold one request slot for the duration of the block."""
+        # Created lazily so the condition binds to the running event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        condition = self._condition
+
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+            now = time.monotonic()
+            self._prune(now)
+            self._timestamps.append(now)
+        try:
+            yield
+        finally:
+            async with condition:
+                self._in_flight -= 1
+                condition.notify_all()
+
+    def observe(self, status: int, latency: float) -> None:
+        """Adjust the concurrency limit from a response status and latency."""
+        self._latencies.append(latency)
+        average = sum(self._latencies) / len(self._latencies)
+
+        if status == 429 or average > self.target_latency:
+            self.limit = max(float(self.min_concurrency), self.limit * 0.5)
+        else:
+            self.limit = min(float(self.max_concurrency), self.limit + 0.5)
+
+    def reset(self) -> None:
+        """Drop state tied to a previous event loop."""
+        self._condition = None
+        self._in_flight = 0
+
+    def _prune(self, now: float) -> None:
+        """Drop request timestamps that fell out of the sliding window."""
+        cutoff = now - self.window
+        while self._timestamps and self._timestamps[0] < cutoff:
+            self._timestamps.popleft()
+
+    @property
+    def requests_per_minute(self) -> int:
+        """Number of requests started within the sliding window."""
+        self._prune(time.monotonic())
+        return len(self._timestamps)
+
+
+class _PendingBatch:
+    """Single-text async requests waiting to be sent as one API call."""
+
+    def __init__(self) -> None:
+        self.texts: List[str] = []
+        self.futures: List[asyncio.Future[Dict[str, Any]]] = []
+        self.chars = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+def _retry_after(headers: Any) -> float:
+    """Parse a Retry-After header in seconds, defaulting to one second."""
+    try:
+        return max(float(headers.get("Retry-After", "1")), 0.0)
+    except (TypeError, ValueError):
+        return 1.0
+
 
 class DeepLTranslator(BaseTranslationProvider):
     """DeepL API provider implementation."""
@@ -22,14 +251,33 @@ class DeepLTranslator(BaseTranslationProvider):
     supports_async = True
     min_supported_version = "0.1.8"
     max_chunk_size = 30000  # DeepL's character limit per request
+    max_batch_size = 50  # DeepL's text array limit per request
+    batch_interval = 0.01  # Seconds to collect concurrent translate_async calls
+    max_connections = 100  # aiohttp connection pool size
+    max_connections_per_host = 64  # Also caps the AIMD concurrency limit
 
     def __init__(self, config: TranslationConfig) -> None:
         """Initialize DeepL translator with configuration."""
         super().__init__(config)
 
+        # Request headers don't change for the life of the provider
+        self._headers = {
+            "Authorization": f"DeepL-Auth-Key {config.api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": self.get_user_agent()  # Uses base class method
+        }
+
         # Initialize DeepL client
         self._client: Optional[deepl.Translator] = None
         self._async_session: Optional[aiohttp.ClientSession] = None
+        self._session_lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._aiohttp_timeout = aiohttp.ClientTimeout(total=config.timeout)
+        self._limiter = _DeepLLimiter(
+            max_concurrency=self.max_connections_per_host
+        )
+        self._pending_batches: Dict[Tuple[Optional[str], str], _PendingBatch] = {}
+        self._batch_tasks: Set[asyncio.Future[None]] = set()
 
         # DeepL API endpoint configuration
         self.is_free_api = self._is_free_api_key(config.api_key)
@@ -47,7 +295,11 @@ class DeepLTranslator(BaseTranslationProvider):
 
     @property
     def client(self) -> deepl.Translator:
-        """Get or create DeepL client."""
+        """Get or create DeepL client.
+
+        The SDK keeps one pooled ``requests.Session`` per client and retries
+        429/5xx responses with backoff, so the client is cached and reused.
+        """
         if self._client is None:
             endpoint = None
             if hasattr(self.config, 'endpoint') and self.config.endpoint:
@@ -59,70 +311,261 @@ class DeepLTranslator(BaseTranslationProvider):
             )
         return self._client
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get request headers for direct API calls."""
-        return {
-            "Authorization": f"DeepL-Auth-Key {self.config.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": self.get_user_agent()  # Uses base class method
+    def _bind_loop(self) -> None:
+        """Reset loop-bound async state when the running event loop changes.
+
+        The session, its lock, the limiter's condition and pending batches
+        all belong to the loop they were created on, so a translator reused
+        across ``asyncio.run`` calls must rebuild them.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        # A session left open on a finished loop can no longer be closed;
+        # callers should aclose() before their loop ends
+        self._async_session = None
+        self._session_lock = None
+        self._limiter.reset()
+        self._pending_batches = {}
+        self._batch_tasks = set()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared aiohttp session.
+
+        The session owns the connection pool, so reusing it keeps TCP/TLS
+        connections to DeepL alive between requests.
+        """
+        self._bind_loop()
+
+        # Created lazily so the lock binds to the running event loop
+        if self._session_lock is None:
+            self._session_lock = asyncio.Lock()
+
+        async with self._session_lock:
+            if self._async_session is None or self._async_session.closed:
+                self._async_session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=self.max_connections,
+                        limit_per_host=self.max_connections_per_host,
+                        keepalive_timeout=75,
+                        ttl_dns_cache=300
+                    ),
+                    timeout=self._aiohttp_timeout
+                )
+        return self._async_session
+
+    async def aclose(self) -> None:
+        """Close the shared aiohttp session and the DeepL SDK client.
+
+        Call this at application shutdown to release pooled connections.
+        Pending batched requests are sent before the session is closed.
+        """
+        self._bind_loop()
+        for key, batch in list(self._pending_batches.items()):
+            self._dispatch_batch(key, batch)
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self.close()
+
+    async def __aenter__(self) -> DeepLTranslator:
+        """Enter an async context that closes the translator on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Release pooled connections."""
+        await self.aclose()
+
+    async def _post_translate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """POST to /v2/translate, backing off on HTTP 429 responses."""
+        session = await self._get_session()
+        attempt = 0
+
+        while True:
+            async with self._limiter.acquire():
+                started = time.monotonic()
+                async with session.post(
+                    f"{self.base_url}/v2/translate",
+                    headers=self._get_headers(),
+                    data=orjson.dumps(data)
+                ) as response:
+                    self._limiter.observe(
+                        response.status, time.monotonic() - started
+                    )
+                    if (
+                        response.status != 429
+                        or attempt >= _MAX_RATE_LIMIT_RETRIES
+                    ):
+                        response.raise_for_status()
+                        result: Dict[str, Any] = orjson.loads(
+                            await response.read()
+                        )
+                        return result
+                    delay = _retry_after(response.headers) * 2 ** attempt
+
+            attempt += 1
+            logger.warning(
+                f"DeepL rate limit hit ({self._limiter.requests_per_minute} "
+                f"requests in the last minute), retry {attempt} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def _build_payload(
+        self, texts: List[str], source_mapped: Optional[str], target_mapped: str
+    ) -> Dict[str, Any]:
+        """Build the /v2/translate request body."""
+        data: Dict[str, Any] = {
+            "text": texts,
+            "target_lang": target_mapped
         }
+        if source_mapped:
+            data["source_lang"] = source_mapped
+        return data
+
+    def _pack_batches(
+        self, texts: List[str], indices: List[int]
+    ) -> List[List[int]]:
+        """Greedily pack text indices into batches within DeepL's limits.
+
+        Each batch stays under ``max_chunk_size`` characters and
+        ``max_batch_size`` texts; a single oversize text gets its own batch.
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        chars = 0
+
+        for i in indices:
+            size = len(texts[i])
+            if current and (
+                chars + size > self.max_chunk_size
+                or len(current) >= self.max_batch_size
+            ):
+                batches.append(current)
+                current = []
+                chars = 0
+            current.append(i)
+            chars += size
+
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _translate_batched(
+        self, text: str, source_mapped: Optional[str], target_mapped: str
+    ) -> Dict[str, Any]:
+        """Queue a single text and return its DeepL translation entry.
+
+        Concurrent calls for the same language pair are coalesced into one
+        request, sent after ``batch_interval`` seconds or once the batch is
+        full.
+        """
+        self._bind_loop()
+        loop = asyncio.get_running_loop()
+        key = (source_mapped, target_mapped)
+
+        batch = self._pending_batches.get(key)
+        if batch is not None and batch.chars + len(text) > self.max_chunk_size:
+            self._dispatch_batch(key, batch)
+            batch = None
+        if batch is None:
+            batch = _PendingBatch()
+            batch.timer = loop.call_later(
+                self.batch_interval, self._dispatch_batch, key, batch
+            )
+            self._pending_batches[key] = batch
+
+        future: asyncio.Future[Dict[str, Any]] = loop.create_future()
+        batch.texts.append(text)
+        batch.futures.append(future)
+        batch.chars += len(text)
+
+        if len(batch.texts) >= self.max_batch_size:
+            self._dispatch_batch(key, batch)
+
+        return await future
+
+    def _dispatch_batch(
+        self, key: Tuple[Optional[str], str], batch: _PendingBatch
+    ) -> None:
+        """Stop collecting texts for a batch and start sending it."""
+        if self._pending_batches.get(key) is not batch:
+            return
+        del self._pending_batches[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        task = asyncio.ensure_future(self._send_batch(key, batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(
+        self, key: Tuple[Optional[str], str], batch: _PendingBatch
+    ) -> None:
+        """Send a batch and resolve each caller's future."""
+        data = self._build_payload(batch.texts, *key)
+
+        error: Exception = TranslationError(
+            "DeepL returned fewer translations than requested"
+        )
+        try:
+            result = await self._post_translate(data)
+            for future, translation in zip(batch.futures, result["translations"]):
+                if not future.done():
+                    future.set_result(translation)
+        except Exception as e:
+            error = e
+        except BaseException:
+            # The send itself was cancelled, so cancel its callers too
+            for future in batch.futures:
+                if not future.done():
+                    future.cancel()
+            raise
+
+        for future in batch.futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def close(self) -> None:
+        """Close the DeepL SDK client and its pooled HTTP session."""
+        if self._client is not None:
+            self._client.close()
+        self._client = None
 
-    def _get_root_lang_code(self, lang_code: str) -> str:
-        if '-' in lang_code:
-            return lang_code.split('-')[0].lower()
-        return lang_code
-
+    def _get_headers(self) -> Dict[str, str]:
+        """Get request headers for direct API calls."""
+        return self._headers
+
+    def _translation_response(
+        self,
+        translated_text: str,
+        detected_code: Optional[str],
+        text: str,
+        source_lang: str,
+        target_lang: str,
+    ) -> TranslationResponse:
+        """Build a successful response for one translated text."""
+        char_count = len(text)
+        return self._create_response(
+            translated_text=translated_text,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            char_count=char_count,
+            metadata={
+                **_BASE_METADATA,
+                "detected_language": _detected_language(
+                    detected_code, source_lang
+                ),
+                "billed_characters": char_count
+            }
+        )
 
     def _map_language_code(self, lang_code: str) -> str:
-        """Map language codes to DeepL format."""
-        # DeepL language mapping
-        supported_language_map = {
-            "ar": "AR",
-            "bg": "BG",
-            "cs": "CS",
-            "da": "DA",
-            "de": "DE",
-            "el": "EL",
-            "en": "EN",
-            "en-GB": "EN-GB",
-            "en-US": "EN-US",
-            "es": "ES",
-            "es-419": "ES-419",
-            "et": "ET",
-            "fi": "FI",
-            "fr": "FR",
-            "he": "HE",
-            "hu": "HU",
-            "id": "ID",
-            "it": "IT",
-            "ja": "JA",
-            "ko": "KO",
-            "lt": "LT",
-            "lv": "LV",
-            "nb": "NB",
-            "nl": "NL",
-            "pl": "PL",
-            "pt": "PT",
-            "pt-BR": "PT-BR",
-            "pt-PT": "PT-PT",
-            "ro": "RO",
-            "ru": "RU",
-            "sk": "SK",
-            "sl": "SL",
-            "sv": "SV",
-            "th": "TH",
-            "tr": "TR",
-            "uk": "UK",
-            "vi": "VI",
-            "zh": "ZH",
-            "zh-HANS": "ZH-HANS",
-            "zh-HANT": "ZH-HANT"
-        }
-
-        # Check if we have a specific mapping
-        if lang_code in supported_language_map:
-            return supported_language_map[lang_code]
-        raise ValueError(f'Unsupported Language: {lang_code}')
+        """Map language codes to DeepL format, falling back to the root code."""
+        return _resolve_lang(lang_code)
 
     def translate(
         self, text: str, source_lang: str, target_lang: str
@@ -130,7 +573,7 @@ class DeepLTranslator(BaseTranslationProvider):
         """Translate single text using DeepL API."""
         try:
             # Validate input
-            if not text.strip():
+            if not text or text.isspace():
                 return self._create_response(
                     translated_text="",
                     source_lang=source_lang,
@@ -146,16 +589,7 @@ class DeepLTranslator(BaseTranslationProvider):
                 raise TranslationError(error_msg)
 
             # Map language codes
-            source_mapped = None
-            if source_lang != "auto":
-                source_mapped = self._map_language_code(
-                    self._get_root_lang_code(source_lang))
-            try:
-                target_mapped = self._map_language_code(target_lang)
-            except ValueError:
-                target_mapped = self._map_language_code(
-                    self._get_root_lang_code(target_lang)
-                )
+            source_mapped, target_mapped = _resolve_pair(source_lang, target_lang)
 
             # Perform translation using DeepL SDK
             result = self.client.translate_text(
@@ -164,23 +598,9 @@ class DeepLTranslator(BaseTranslationProvider):
                 target_lang=target_mapped
             )
 
-            # Extract metadata
-            detected_lang = source_lang
-            if result.detected_source_lang:
-                detected_lang = result.detected_source_lang.lower()
-
-            return self._create_response(
-                translated_text=result.text,
-                source_lang=source_lang,
-                target_lang=target_lang,
-                char_count=len(text),
-                metadata={
-                    "detected_language": detected_lang,
-                    "confidence": 1.0,  # DeepL doesn't provide scores
-                    "provider": "deepl",
-                    "model": "deepl-api",
-                    "billed_characters": len(text)
-                }
+            return self._translation_response(
+                result.text, result.detected_source_lang,
+                text, source_lang, target_lang
             )
 
         except deepl.QuotaExceededException as e:
@@ -220,31 +640,20 @@ class DeepLTranslator(BaseTranslationProvider):
 
         try:
             # Filter out empty texts but maintain positions
-            text_mapping = {}
-            valid_texts = []
-
-            for i, text in enumerate(texts):
-                if text.strip():
-                    text_mapping[len(valid_texts)] = i
-                    valid_texts.append(text)
+            valid_indices = [
+                i for i, text in enumerate(texts) if text and not text.isspace()
+            ]
+            dense = len(valid_indices) == len(texts)
+            valid_texts = texts if dense else [texts[i] for i in valid_indices]
 
-            if not valid_texts:
+            if not valid_indices:
                 return [
                     self._create_response("", source_lang, target_lang, 0)
                     for _ in texts
                 ]
 
-            if source_lang != "auto":
-                source_mapped = self._map_language_code(
-                    self._get_root_lang_code(source_lang))
-            else:
-                source_mapped = None
-            try:
-                target_mapped = self._map_language_code(target_lang)
-            except ValueError:
-                target_mapped = self._map_language_code(
-                    self._get_root_lang_code(target_lang)
-                )
+            # Map language codes
+            source_mapped, target_mapped = _resolve_pair(source_lang, target_lang)
 
             # Perform bulk translation
             results = self.client.translate_text(
@@ -257,34 +666,31 @@ class DeepLTranslator(BaseTranslationProvider):
             if not isinstance(results, list):
                 results = [results]
 
-            # Create response mapping
-            responses = [None] * len(texts)
+            # Common case: every text is non-empty, so results line up 1:1
+            if dense and len(results) == len(texts):
+                return [
+                    self._translation_response(
+                        result.text, result.detected_source_lang,
+                        text, source_lang, target_lang
+                    )
+                    for text, result in zip(texts, results)
+                ]
 
-            for i, result in enumerate(results):
-                original_index = text_mapping[i]
-                detected_lang = result.detected_source_lang.lower() if result.detected_source_lang else source_lang
+            # Empty texts, and any the API left out, keep an empty response;
+            # valid ones are scattered back
+            responses = [
+                self._create_response("", source_lang, target_lang, 0)
+                for _ in texts
+            ]
 
-                responses[original_index] = self._create_response(
-                    translated_text=result.text,
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                    char_count=len(texts[original_index]),
-                    metadata={
-                        "detected_language": detected_lang,
-                        "confidence": 1.0,
-                        "provider": "deepl",
-                        "model": "deepl-api",
-                        "billed_characters": len(texts[original_index])
-                    }
+            for i, result in zip(valid_indices, results):
+                responses[i] = self._translation_response(
+                    result.text, result.detected_source_lang,
+                    texts[i], source_lang, target_lang
                 )
-                
-            # Fill in empty responses for empty texts
-            for i, response in enumerate(responses):
-                if response is None:
-                    responses[i] = self._create_response("", source_lang, target_lang, 0)
-                    
+
             return responses
-            
+
         except deepl.QuotaExceededException as e:
             logger.error(f"DeepL quota exceeded: {str(e)}")
             return [
@@ -328,7 +734,7 @@ class DeepLTranslator(BaseTranslationProvider):
         """Async translate single text using DeepL API."""
         try:
             # Validate input
-            if not text.strip():
+            if not text or text.isspace():
                 return self._create_response(
                     translated_text="",
                     source_lang=source_lang,
@@ -341,52 +747,16 @@ class DeepLTranslator(BaseTranslationProvider):
                     f"Text length ({len(text)}) exceeds DeepL's maximum of {self.max_chunk_size} characters"
                 )
 
-            if source_lang != "auto":
-                source_mapped = self._map_language_code(
-                    self._get_root_lang_code(source_lang))
-            else:
-                source_mapped = None
-            try:
-                target_mapped = self._map_language_code(target_lang)
-            except ValueError:
-                target_mapped = self._map_language_code(
-                    self._get_root_lang_code(target_lang)
-                )
-            # Prepare request data
-            data = {
-                "text": [text],
-                "target_lang": target_mapped
-            }
-
-            if source_mapped:
-                data["source_lang"] = source_mapped
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/v2/translate",
-                    headers=self._get_headers(),
-                    json=data,
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-                ) as response:
-                    response.raise_for_status()
-                    result = await response.json()
-
-            # Extract translation result
-            translation = result["translations"][0]
-            detected_lang = translation.get("detected_source_language", source_lang).lower()
+            # Map language codes
+            source_mapped, target_mapped = _resolve_pair(source_lang, target_lang)
 
-            return self._create_response(
-                translated_text=translation["text"],
-                source_lang=source_lang,
-                target_lang=target_lang,
-                char_count=len(text),
-                metadata={
-                    "detected_language": detected_lang,
-                    "confidence": 1.0,
-                    "provider": "deepl",
-                    "model": "deepl-api",
-                    "billed_characters": len(text)
-                }
+            # Coalesced with concurrent calls into one request
+            translation = await self._translate_batched(
+                text, source_mapped, target_mapped
+            )
+            return self._translation_response(
+                translation["text"], translation.get("detected_source_language"),
+                text, source_lang, target_lang
             )
 
         except aiohttp.ClientError as e:
@@ -417,76 +787,86 @@ class DeepLTranslator(BaseTranslationProvider):
 
         try:
             # Filter out empty texts but maintain positions
-            text_mapping = {}
-            valid_texts = []
-
-            for i, text in enumerate(texts):
-                if text.strip():
-                    text_mapping[len(valid_texts)] = i
-                    valid_texts.append(text)
+            valid_indices = [
+                i for i, text in enumerate(texts) if text and not text.isspace()
+            ]
 
-            if not valid_texts:
+            if not valid_indices:
                 return [
                     self._create_response("", source_lang, target_lang, 0)
                     for _ in texts
                 ]
 
             # Map language codes
-            if source_lang != "auto":
-                source_mapped = self._map_language_code(
-                    self._get_root_lang_code(source_lang))
-            else:
-                source_mapped = None
-            try:
-                target_mapped = self._map_language_code(target_lang)
-            except ValueError:
-                target_mapped = self._map_language_code(
-                    self._get_root_lang_code(target_lang)
-                )
-            # Prepare request data
-            data = {
-                "text": valid_texts,
-                "target_lang": target_mapped
-            }
-
-            if source_mapped:
-                data["source_lang"] = source_mapped
+            source_mapped, target_mapped = _resolve_pair(source_lang, target_lang)
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/v2/translate",
-                    headers=self._get_headers(),
-                    json=data,
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-                ) as response:
-                    response.raise_for_status()
-                    result = await response.json()
-
-            # Create response mapping
-            responses = [None] * len(texts)
-
-            for i, translation in enumerate(result["translations"]):
-                original_index = text_mapping[i]
-                detected_lang = translation.get("detected_source_language", source_lang).lower()
+            # Empty texts, and any the API left out, keep an empty response;
+            # valid ones are scattered back
+            responses: List[TranslationResponse] = [
+                self._create_response("", source_lang, target_lang, 0)
+                for _ in texts
+            ]
 
-                responses[original_index] = self._create_response(
-                    translated_text=translation["text"],
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                    char_count=len(texts[original_index]),
-                    metadata={
-                        "detected_language": detected_lang,
-                        "confidence": 1.0,
-                        "provider": "deepl",
-                        "model": "deepl-api",
-                        "billed_characters": len(texts[original_index])
-                    }
-                )
+            # Texts over DeepL's limit would be rejected, so they fail up front
+            sendable: List[int] = []
+            for i in valid_indices:
+                if len(texts[i]) > self.max_chunk_size:
+                    responses[i] = self._create_response(
+                        translated_text="",
+                        source_lang=source_lang,
+                        target_lang=target_lang,
+                        char_count=len(texts[i]),
+                        error=(
+                            f"Text length ({len(texts[i])}) exceeds DeepL's "
+                            f"maximum of {self.max_chunk_size} characters"
+                        )
+                    )
+                else:
+                    sendable.append(i)
+
+            async def translate_batch(batch: List[int]) -> None:
+                result = await self._post_translate(self._build_payload(
+                    [texts[i] for i in batch], source_mapped, target_mapped
+                ))
+                # Scatter as soon as this batch lands so its parsed body can
+                # be released while other batches are still in flight
+                for i, translation in zip(batch, result["translations"]):
+                    responses[i] = self._translation_response(
+                        translation["text"],
+                        translation.get("detected_source_language"),
+                        texts[i], source_lang, target_lang
+                    )
+
+            # Send size-bounded batches concurrently, limited by the AIMD
+            # limiter. Each batch is billed on its own, so a failed batch only
+            # marks its own texts as errors and successful ones are kept.
+            batches = self._pack_batches(texts, sendable)
+            outcomes = await asyncio.gather(
+                *(translate_batch(batch) for batch in batches),
+                return_exceptions=True
+            )
 
-            # Fill in empty responses for empty texts
-            for i, response in enumerate(responses):
-                if response is None:
-                    responses[i] = self._create_response("", source_lang, target_lang, 0)
+            for batch, outcome in zip(batches, outcomes):
+                if outcome is None:
+                    continue
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                if isinstance(outcome, aiohttp.ClientError):
+                    logger.error(
+                        f"DeepL async bulk translation error: {str(outcome)}"
+                    )
+                    error = f"DeepL API error: {str(outcome)}"
+                else:
+                    logger.error(f"Async bulk translation error: {str(outcome)}")
+                    error = str(outcome)
+                for i in batch:
+                    responses[i] = self._create_response(
+                        translated_text="",
+                        source_lang=source_lang,
+                        target_lang=target_lang,
+                        char_count=len(texts[i]),
+                        error=error
+                    )
 
             return responses
 
@@ -549,13 +929,3 @@ class DeepLTranslator(BaseTranslationProvider):
         except Exception as e:
             logger.error(f"Error fetching usage info: {str(e)}")
             return {}
-
-    def __del__(self):
-        """Cleanup resources."""
-        if self._client:
-            # DeepL client doesn't need explicit cleanup
-            pass
-        if self._async_session and not self._async_session.closed:
-            # Note: In a real application, you should properly close async sessions
-            # This is just a fallback cleanup
-            pass
@@ -1,10 +1,15 @@
 """Test configuration for DeepL provider tests."""
 
+from types import MappingProxyType
+from unittest.mock import Mock
+
 import pytest
 from mt_providers.types import TranslationConfig
 
+from mt_provider_deepl.translator import DeepLTranslator
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def deepl_config():
     """Basic test configuration for DeepL provider."""
     return TranslationConfig(
@@ -13,6 +18,28 @@ def deepl_config():
     )
 
 
+@pytest.fixture(autouse=True)
+def mock_deepl(monkeypatch):
+    """Replace the DeepL SDK client class for every test."""
+    mock = Mock()
+    monkeypatch.setattr("mt_provider_deepl.translator.deepl.Translator", mock)
+    return mock
+
+
+@pytest.fixture
+def deepl_client(mock_deepl):
+    """DeepL SDK client instance returned by the patched constructor."""
+    instance = Mock()
+    mock_deepl.return_value = instance
+    return instance
+
+
+@pytest.fixture(scope="session")
+def shared_translator(deepl_config):
+    """Translator shared by tests that never touch the DeepL client."""
+    return DeepLTranslator(deepl_config)
+
+
 @pytest.fixture
 def deepl_config_pro():
     """Pro tier test configuration for DeepL provider."""
@@ -35,23 +62,23 @@ def sample_texts():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def deepl_response_single():
-    """Mock DeepL API response for single translation."""
-    return {
+    """Mock DeepL API response for single translation (read-only)."""
+    return MappingProxyType({
         "translations": [
             {
                 "detected_source_language": "EN",
                 "text": "¡Hola mundo!"
             }
         ]
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def deepl_response_bulk():
-    """Mock DeepL API response for bulk translation."""
-    return {
+    """Mock DeepL API response for bulk translation (read-only)."""
+    return MappingProxyType({
         "translations": [
             {
                 "detected_source_language": "EN", 
@@ -66,7 +93,7 @@ def deepl_response_bulk():
                 "text": "¡Adiós!"
             }
         ]
-    }
+    })
 
 
 @pytest.fixture
@@ -1,136 +1,257 @@
 """Comprehensive tests for DeepL translator provider."""
 
+import asyncio
+import functools
+import re
+import time
+from types import SimpleNamespace
+
+import aiohttp
+import deepl
+import orjson
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import patch, AsyncMock
 from mt_providers.types import TranslationConfig, TranslationStatus
 from mt_providers.exceptions import ConfigurationError, TranslationError
-from mt_provider_deepl.translator import DeepLTranslator
+from mt_provider_deepl.translator import (
+    _DEEPL_LANG_MAP,
+    DeepLTranslator,
+    _DeepLLimiter,
+    _resolve_pair,
+)
+
+
+_API_KEY_RE = re.compile("API key is required")
+_EMPTY_CFG = TranslationConfig(api_key="")
+
+
+def _r(text, lang="EN"):
+    """Build a stand-in for a DeepL SDK TextResult."""
+    return SimpleNamespace(text=text, detected_source_lang=lang)
+
+
+def _assert_success(r, text, lang="en"):
+    """Check the common shape of a successful translation result."""
+    meta = r["metadata"]
+    assert (r["status"], r["translated_text"], meta["detected_language"], meta["provider"]) == (
+        TranslationStatus.SUCCESS, text, lang, "deepl"
+    )
+
+
+def _run_on_new_loop(coro):
+    """Like asyncio.run, but leaves the test runner's current event loop set."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class _Lang:
+    """Stand-in for a DeepL SDK Language; only ``code`` is read."""
+
+    __slots__ = ("code",)
+
+    def __init__(self, code):
+        self.code = code
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response used as a context manager."""
+
+    def __init__(self, payload=None, status=200, headers=None):
+        self._body = orjson.dumps(payload, default=dict)
+        self.status = status
+        self.headers = headers or {}
+
+    async def read(self):
+        return self._body
+
+    def raise_for_status(self):
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class _FakeSession:
+    """Minimal stand-in for aiohttp.ClientSession that records POSTs.
+
+    Responses are served in order and the last one repeats; an exception in
+    the list is raised from post() instead.
+    """
+
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.posts = []
+        self.closed = False
+        self.close_count = 0
+
+    def post(self, url, **kwargs):
+        self.posts.append(kwargs)
+        item = self._responses.pop(0) if len(self._responses) > 1 else self._responses[0]
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    async def close(self):
+        self.closed = True
+        self.close_count += 1
+
+
+@pytest.fixture
+def fake_aiohttp(monkeypatch):
+    """Install fake aiohttp sessions; call with the responses to serve.
+
+    Returns the list of sessions created by the translator.
+    """
+    sessions = []
+
+    def install(*responses):
+        def factory(*args, **kwargs):
+            session = _FakeSession(responses)
+            sessions.append(session)
+            return session
+
+        monkeypatch.setattr('aiohttp.ClientSession', factory)
+        return sessions
+
+    return install
+
+
+@functools.lru_cache(maxsize=None)
+def _provider_cls():
+    """Look up the registered provider once; entry-point scans are slow."""
+    from mt_providers import get_provider
+
+    return get_provider("deepl")
+
 
 
 class TestDeepLTranslatorInit:
     """Test DeepL translator initialization and configuration."""
 
-    def test_init_with_valid_config(self, deepl_config):
+    def test_init_with_valid_config(self, shared_translator, deepl_config):
         """Test initialization with valid configuration."""
-        translator = DeepLTranslator(deepl_config)
-        
-        assert translator.config == deepl_config
-        assert translator.name == "deepl"
-        assert translator.supports_async is True
-        assert translator.min_supported_version == "0.1.8"
-        assert translator.max_chunk_size == 30000
-        assert translator.requires_region is False
+        assert shared_translator.config == deepl_config
+
+    @pytest.mark.parametrize("attr,expected", [
+        ("name", "deepl"),
+        ("supports_async", True),
+        ("min_supported_version", "0.1.8"),
+        ("max_chunk_size", 30000),
+        ("requires_region", False),
+    ])
+    def test_provider_attributes(self, shared_translator, attr, expected):
+        """Test provider class attributes."""
+        assert getattr(shared_translator, attr) == expected
 
     def test_init_missing_api_key(self):
         """Test initialization with missing API key."""
-        config = TranslationConfig(api_key="")
-        translator = DeepLTranslator(config)
+        translator = DeepLTranslator(_EMPTY_CFG)
         
-        with pytest.raises(ConfigurationError, match="API key is required"):
+        with pytest.raises(ConfigurationError, match=_API_KEY_RE):
             translator.translate("test", "en", "es")
 
-    def test_free_api_key_detection(self, deepl_config):
-        """Test detection of free tier API key."""
-        translator = DeepLTranslator(deepl_config)
-        assert translator.is_free_api is True
-        assert translator.base_url == "https://api-free.deepl.com"
-
-    def test_pro_api_key_detection(self, deepl_config_pro):
-        """Test detection of pro tier API key."""
-        translator = DeepLTranslator(deepl_config_pro)
-        assert translator.is_free_api is False
-        assert translator.base_url == "https://api.deepl.com"
+    @pytest.mark.parametrize("cfg_fixture,is_free,url", [
+        ("deepl_config", True, "https://api-free.deepl.com"),
+        ("deepl_config_pro", False, "https://api.deepl.com"),
+    ])
+    def test_api_key_tier_detection(self, request, cfg_fixture, is_free, url):
+        """Test detection of free vs pro tier API keys."""
+        translator = DeepLTranslator(request.getfixturevalue(cfg_fixture))
+        assert translator.is_free_api is is_free
+        assert translator.base_url == url
 
 
 class TestLanguageMapping:
     """Test language code mapping functionality."""
 
-    def test_language_mapping(self, deepl_config):
+    @pytest.mark.parametrize("src,expected", [
+        ("en", "EN"),
+        ("en-US", "EN-US"),
+        ("pt", "PT"),
+        ("pt-PT", "PT-PT"),
+        ("zh", "ZH"),
+        ("de", "DE"),
+        ("fr", "FR"),
+        ("es", "ES"),
+    ])
+    def test_language_mapping(self, shared_translator, src, expected):
         """Test language code mapping to DeepL format."""
-        translator = DeepLTranslator(deepl_config)
-        
-        # Test specific mappings
-        assert translator._map_language_code("en") == "EN-US"
-        assert translator._map_language_code("pt") == "PT-PT"
-        assert translator._map_language_code("zh") == "ZH"
-        
-        # Test uppercase conversion
-        assert translator._map_language_code("de") == "DE"
-        assert translator._map_language_code("fr") == "FR"
-        assert translator._map_language_code("es") == "ES"
+        assert shared_translator._map_language_code(src) == expected
+
+    def test_language_mapping_root_fallback(self, shared_translator):
+        """Test regional variants fall back to their root language."""
+        translator = shared_translator
+
+        assert translator._map_language_code("pt-BR") == "PT-BR"
+        assert translator._map_language_code("de-AT") == "DE"
+        assert translator._map_language_code("FR-CA") == "FR"
+        assert translator._map_language_code("pt-br") == "PT-BR"
+        assert translator._map_language_code("EN-GB") == "EN-GB"
+
+        with pytest.raises(ValueError, match="Unsupported Language"):
+            translator._map_language_code("xx-YY")
+
+    def test_language_map_is_read_only(self):
+        """Test that the shared language map cannot be mutated."""
+        with pytest.raises(TypeError):
+            _DEEPL_LANG_MAP["xx"] = "XX"
+
+    def test_resolve_pair(self):
+        """Test source/target pair resolution."""
+        assert _resolve_pair("auto", "es") == (None, "ES")
+        assert _resolve_pair("pt-BR", "en-GB") == ("PT", "EN-GB")
 
 
 class TestSyncTranslation:
     """Test synchronous translation methods."""
 
-    @patch('deepl.Translator')
-    def test_translate_success(self, mock_deepl_client, deepl_config):
+    def test_translate_success(self, deepl_client, deepl_config):
         """Test successful single text translation."""
-        # Setup mock
-        mock_result = Mock()
-        mock_result.text = "¡Hola mundo!"
-        mock_result.detected_source_lang = "EN"
-        
-        mock_client_instance = Mock()
-        mock_client_instance.translate_text.return_value = mock_result
-        mock_deepl_client.return_value = mock_client_instance
+        deepl_client.translate_text.return_value = _r("¡Hola mundo!")
         
         translator = DeepLTranslator(deepl_config)
         result = translator.translate("Hello world", "en", "es")
-        
-        assert result["translated_text"] == "¡Hola mundo!"
-        assert result["status"] == TranslationStatus.SUCCESS
-        assert result["metadata"]["detected_language"] == "en"
-        assert result["metadata"]["provider"] == "deepl"
 
-    @patch('deepl.Translator')
-    def test_translate_empty_text(self, mock_deepl_client, deepl_config):
+        _assert_success(result, "¡Hola mundo!")
+
+    def test_translate_empty_text(self, shared_translator):
         """Test translation of empty text."""
-        translator = DeepLTranslator(deepl_config)
-        result = translator.translate("", "en", "es")
-        
+        result = shared_translator.translate("", "en", "es")
+
         assert result["translated_text"] == ""
         assert result["status"] == TranslationStatus.SUCCESS
         assert result["char_count"] == 0
 
-    @patch('deepl.Translator')
-    def test_translate_text_too_long(self, mock_deepl_client, deepl_config):
+    def test_translate_text_too_long(self, shared_translator):
         """Test translation with text exceeding character limit."""
-        translator = DeepLTranslator(deepl_config)
         long_text = "a" * 30001  # Exceeds max_chunk_size
-        
-        result = translator.translate(long_text, "en", "es")
+
+        result = shared_translator.translate(long_text, "en", "es")
         assert result["status"] == TranslationStatus.ERROR
         assert "exceeds DeepL's maximum" in result["error"]
 
-    @patch('deepl.Translator')
-    def test_translate_with_auto_detect(self, mock_deepl_client, deepl_config):
+    def test_translate_with_auto_detect(self, deepl_client, deepl_config):
         """Test translation with automatic language detection."""
-        mock_result = Mock()
-        mock_result.text = "¡Hola mundo!"
-        mock_result.detected_source_lang = "EN"
-        
-        mock_client_instance = Mock()
-        mock_client_instance.translate_text.return_value = mock_result
-        mock_deepl_client.return_value = mock_client_instance
+        deepl_client.translate_text.return_value = _r("¡Hola mundo!")
         
         translator = DeepLTranslator(deepl_config)
         result = translator.translate("Hello world", "auto", "es")
         
         # Verify source_lang=None was passed (auto detection)
-        call_args = mock_client_instance.translate_text.call_args
+        call_args = deepl_client.translate_text.call_args
         assert call_args[1]["source_lang"] is None
 
-    @patch('deepl.Translator')
-    def test_translate_deepl_api_error(self, mock_deepl_client, deepl_config):
+    def test_translate_deepl_api_error(self, deepl_client, deepl_config):
         """Test handling of DeepL API errors."""
-        import deepl
-        
-        mock_client_instance = Mock()
-        mock_client_instance.translate_text.side_effect = deepl.DeepLException(
+        deepl_client.translate_text.side_effect = deepl.DeepLException(
             "API quota exceeded"
         )
-        mock_deepl_client.return_value = mock_client_instance
         
         translator = DeepLTranslator(deepl_config)
         result = translator.translate("Hello", "en", "es")
@@ -142,49 +263,45 @@ class TestSyncTranslation:
 class TestBulkTranslation:
     """Test bulk translation methods."""
 
-    @patch('deepl.Translator')
-    def test_bulk_translate_success(self, mock_deepl_client, deepl_config):
+    def test_bulk_translate_success(self, deepl_client, deepl_config):
         """Test successful bulk translation."""
-        # Setup mock responses
-        mock_results = []
         texts = ["Hello", "Goodbye", "Thank you"]
         translations = ["Hola", "Adiós", "Gracias"]
-        
-        for translation in translations:
-            result = Mock()
-            result.text = translation
-            result.detected_source_lang = "EN"
-            mock_results.append(result)
-        
-        mock_client_instance = Mock()
-        mock_client_instance.translate_text.return_value = mock_results
-        mock_deepl_client.return_value = mock_client_instance
+
+        deepl_client.translate_text.return_value = [_r(t) for t in translations]
         
         translator = DeepLTranslator(deepl_config)
         results = translator.bulk_translate(texts, "en", "es")
         
-        assert len(results) == 3
-        for i, result in enumerate(results):
-            assert result["translated_text"] == translations[i]
-            assert result["status"] == TranslationStatus.SUCCESS
+        assert [r["translated_text"] for r in results] == translations
+        assert all(r["status"] == TranslationStatus.SUCCESS for r in results)
+
+    def test_bulk_translate_short_result(self, deepl_client, deepl_config):
+        """Test that texts missing from the API result get empty responses."""
+        deepl_client.translate_text.return_value = [_r("Hola")]
 
-    @patch('deepl.Translator')
-    def test_bulk_translate_empty_list(self, mock_deepl_client, deepl_config):
-        """Test bulk translation with empty list."""
         translator = DeepLTranslator(deepl_config)
-        results = translator.bulk_translate([], "en", "es")
+        results = translator.bulk_translate(["Hello", "Goodbye"], "en", "es")
+
+        assert [r["translated_text"] for r in results] == ["Hola", ""]
+
+    def test_bulk_translate_empty_list(self, shared_translator):
+        """Test bulk translation with empty list."""
+        results = shared_translator.bulk_translate([], "en", "es")
         assert results == []
 
-    @patch('deepl.Translator')
-    def test_bulk_translate_with_empty_texts(self, mock_deepl_client, deepl_config):
+    def test_bulk_translate_all_empty_skips_language_mapping(self, mock_deepl, deepl_config):
+        """Test that all-empty input returns before language codes are resolved."""
+        translator = DeepLTranslator(deepl_config)
+        results = translator.bulk_translate(["", "   "], "en", "xx")
+
+        assert [r["translated_text"] for r in results] == ["", ""]
+        assert all(r["status"] == TranslationStatus.SUCCESS for r in results)
+        mock_deepl.assert_not_called()
+
+    def test_bulk_translate_with_empty_texts(self, deepl_client, deepl_config):
         """Test bulk translation with some empty texts."""
-        mock_result = Mock()
-        mock_result.text = "Hola"
-        mock_result.detected_source_lang = "EN"
-        
-        mock_client_instance = Mock()
-        mock_client_instance.translate_text.return_value = [mock_result]
-        mock_deepl_client.return_value = mock_client_instance
+        deepl_client.translate_text.return_value = [_r("Hola"), _r("Hola")]
         
         translator = DeepLTranslator(deepl_config)
         texts = ["Hello", "", "World"]
@@ -199,76 +316,226 @@ class TestBulkTranslation:
 class TestAsyncTranslation:
     """Test asynchronous translation methods."""
 
-    @pytest.mark.asyncio
-    async def test_translate_async_success(self, deepl_config, deepl_response_single):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_translate_async_success(self, fake_aiohttp, deepl_config, deepl_response_single):
         """Test successful async translation."""
-        with patch('aiohttp.ClientSession') as mock_session:
-            # Setup mock response
-            mock_response = AsyncMock()
-            mock_response.json.return_value = deepl_response_single
-            mock_response.raise_for_status.return_value = None
-            
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
-            
-            translator = DeepLTranslator(deepl_config)
-            result = await translator.translate_async("Hello world", "en", "es")
-            
-            assert result["translated_text"] == "¡Hola mundo!"
-            assert result["status"] == TranslationStatus.SUCCESS
-            assert result["metadata"]["detected_language"] == "en"
+        fake_aiohttp(_FakeResponse(deepl_response_single))
+
+        translator = DeepLTranslator(deepl_config)
+        result = await translator.translate_async("Hello world", "en", "es")
+
+        _assert_success(result, "¡Hola mundo!")
 
-    @pytest.mark.asyncio
-    async def test_bulk_translate_async_success(self, deepl_config, deepl_response_bulk):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_bulk_translate_async_success(self, fake_aiohttp, deepl_config, deepl_response_bulk):
         """Test successful async bulk translation."""
-        with patch('aiohttp.ClientSession') as mock_session:
-            # Setup mock response
-            mock_response = AsyncMock()
-            mock_response.json.return_value = deepl_response_bulk
-            mock_response.raise_for_status.return_value = None
-            
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
-            
+        fake_aiohttp(_FakeResponse(deepl_response_bulk))
+
+        translator = DeepLTranslator(deepl_config)
+        texts = ["Hello world", "How are you?", "Goodbye"]
+        results = await translator.bulk_translate_async(texts, "en", "es")
+
+        assert [r["translated_text"] for r in results] == [
+            "¡Hola mundo!", "¿Cómo estás?", "¡Adiós!"
+        ]
+        assert all(r["status"] == TranslationStatus.SUCCESS for r in results)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_bulk_translate_async_short_result(self, fake_aiohttp, deepl_config, deepl_response_single):
+        """Test that texts missing from the async API result get empty responses."""
+        fake_aiohttp(_FakeResponse(deepl_response_single))
+
+        translator = DeepLTranslator(deepl_config)
+        results = await translator.bulk_translate_async(["Hello world", "Goodbye"], "en", "es")
+
+        assert [r["translated_text"] for r in results] == ["¡Hola mundo!", ""]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_bulk_translate_async_partial_batch_failure(self, fake_aiohttp, deepl_config, deepl_response_single):
+        """Test that a failed batch does not discard other batches' results."""
+        fake_aiohttp(
+            _FakeResponse(deepl_response_single),
+            aiohttp.ClientError("Server error"),
+        )
+
+        translator = DeepLTranslator(deepl_config)
+        translator.max_batch_size = 1
+        ok, failed = await translator.bulk_translate_async(["Hello world", "Goodbye"], "en", "es")
+
+        _assert_success(ok, "¡Hola mundo!")
+        assert failed["status"] == TranslationStatus.ERROR
+        assert failed["error"] == "DeepL API error: Server error"
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_bulk_translate_async_text_too_long(self, fake_aiohttp, deepl_config, deepl_response_single):
+        """Test that an oversize text gets its own error and is never sent."""
+        sessions = fake_aiohttp(_FakeResponse(deepl_response_single))
+
+        translator = DeepLTranslator(deepl_config)
+        ok, too_long = await translator.bulk_translate_async(["Hello world", "a" * 30001], "en", "es")
+
+        _assert_success(ok, "¡Hola mundo!")
+        assert too_long["status"] == TranslationStatus.ERROR
+        assert "exceeds DeepL's maximum" in too_long["error"]
+        assert [orjson.loads(p["data"])["text"] for p in sessions[0].posts] == [["Hello world"]]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_async_session_is_reused(self, fake_aiohttp, deepl_config, deepl_response_single):
+        """Test that async calls share one aiohttp session until closed."""
+        sessions = fake_aiohttp(_FakeResponse(deepl_response_single))
+
+        translator = DeepLTranslator(deepl_config)
+        await translator.translate_async("Hello world", "en", "es")
+        await translator.translate_async("Hello world", "en", "es")
+
+        assert len(sessions) == 1
+        assert len(sessions[0].posts) == 2
+
+        await translator.aclose()
+        assert sessions[0].close_count == 1
+
+    def test_async_state_rebuilt_per_event_loop(self, fake_aiohttp, deepl_config, deepl_response_single):
+        """Test that a translator reused across asyncio.run calls rebinds its state."""
+        sessions = fake_aiohttp(_FakeResponse(deepl_response_single))
+        translator = DeepLTranslator(deepl_config)
+
+        first = _run_on_new_loop(translator.translate_async("Hello world", "en", "es"))
+        condition = translator._limiter._condition
+        second = _run_on_new_loop(translator.bulk_translate_async(["Hello world"], "en", "es"))
+
+        _assert_success(first, "¡Hola mundo!")
+        _assert_success(second[0], "¡Hola mundo!")
+        assert len(sessions) == 2
+        assert translator._limiter._condition is not condition
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_translate_async_coalesces_concurrent_calls(self, fake_aiohttp, deepl_config, deepl_response_bulk):
+        """Test that concurrent single-text calls share one API request."""
+        sessions = fake_aiohttp(_FakeResponse(deepl_response_bulk))
+
+        translator = DeepLTranslator(deepl_config)
+        texts = ["Hello world", "How are you?", "Goodbye"]
+        results = await asyncio.gather(
+            *(translator.translate_async(text, "en", "es") for text in texts)
+        )
+
+        assert len(sessions[0].posts) == 1
+        assert orjson.loads(sessions[0].posts[0]["data"])["text"] == texts
+        assert [r["translated_text"] for r in results] == [
+            "¡Hola mundo!", "¿Cómo estás?", "¡Adiós!"
+        ]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_translate_async_short_batch_response(self, fake_aiohttp, deepl_config, deepl_response_single):
+        """Test that callers missing from a short batch response get an error."""
+        fake_aiohttp(_FakeResponse(deepl_response_single))
+
+        translator = DeepLTranslator(deepl_config)
+        first, second = await asyncio.gather(
+            translator.translate_async("Hello world", "en", "es"),
+            translator.translate_async("Goodbye", "en", "es"),
+        )
+
+        _assert_success(first, "¡Hola mundo!")
+        assert second["status"] == TranslationStatus.ERROR
+        assert "fewer translations" in second["error"]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_bulk_translate_async_packs_batches(self, fake_aiohttp, deepl_config, deepl_response_bulk):
+        """Test that bulk input is split into batches within DeepL's limits."""
+        sessions = fake_aiohttp(_FakeResponse(deepl_response_bulk))
+
+        translator = DeepLTranslator(deepl_config)
+        translator.max_batch_size = 2
+        texts = ["Hello world", "", "How are you?", "Goodbye"]
+        results = await translator.bulk_translate_async(texts, "en", "es")
+
+        sent = [orjson.loads(post["data"])["text"] for post in sessions[0].posts]
+        assert sent == [["Hello world", "How are you?"], ["Goodbye"]]
+        assert [r["translated_text"] for r in results] == [
+            "¡Hola mundo!", "", "¿Cómo estás?", "¡Hola mundo!"
+        ]
+
+    def test_pack_batches_respects_char_limit(self, deepl_config):
+        """Test greedy packing by character count."""
+        translator = DeepLTranslator(deepl_config)
+        texts = ["a" * 20000, "b" * 9000, "c" * 2000, "d" * 40000]
+
+        assert translator._pack_batches(texts, [0, 1, 2, 3]) == [[0, 1], [2], [3]]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_translate_async_retries_rate_limit(self, fake_aiohttp, deepl_config, deepl_response_single):
+        """Test that HTTP 429 responses are retried after Retry-After."""
+        sessions = fake_aiohttp(
+            _FakeResponse(status=429, headers={"Retry-After": "2"}),
+            _FakeResponse(deepl_response_single),
+        )
+
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
             translator = DeepLTranslator(deepl_config)
-            texts = ["Hello world", "How are you?", "Goodbye"]
-            results = await translator.bulk_translate_async(texts, "en", "es")
-            
-            assert len(results) == 3
-            expected_translations = ["¡Hola mundo!", "¿Cómo estás?", "¡Adiós!"]
-            for i, result in enumerate(results):
-                assert result["translated_text"] == expected_translations[i]
-                assert result["status"] == TranslationStatus.SUCCESS
-
-    @pytest.mark.asyncio
-    async def test_translate_async_api_error(self, deepl_config):
+            result = await translator.translate_async("Hello world", "en", "es")
+
+        assert result["translated_text"] == "¡Hola mundo!"
+        assert len(sessions[0].posts) == 2
+        mock_sleep.assert_awaited_once_with(2.0)
+
+    def test_limiter_aimd(self):
+        """Test additive increase and multiplicative decrease of the limit."""
+        limiter = _DeepLLimiter(min_concurrency=2, max_concurrency=4, target_latency=1.0)
+
+        limiter.observe(200, 0.1)
+        assert limiter.limit == 2.5
+
+        limiter.observe(429, 0.1)
+        assert limiter.limit == 2.0
+
+        for _ in range(10):
+            limiter.observe(200, 0.1)
+        assert limiter.limit == 4.0
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_limiter_prunes_old_timestamps(self):
+        """Test that request timestamps stay bounded by the sliding window."""
+        limiter = _DeepLLimiter()
+        stale = time.monotonic() - limiter.window - 1
+        limiter._timestamps.extend([stale] * 1000)
+
+        async with limiter.acquire():
+            pass
+
+        assert len(limiter._timestamps) == 1
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_async_context_manager_closes_clients(self, fake_aiohttp, deepl_client, deepl_config):
+        """Test that leaving the async context closes both HTTP clients."""
+        sessions = fake_aiohttp(_FakeResponse())
+
+        async with DeepLTranslator(deepl_config) as translator:
+            await translator._get_session()
+            translator.client
+
+        assert sessions[0].close_count == 1
+        deepl_client.close.assert_called_once()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_translate_async_api_error(self, fake_aiohttp, deepl_config):
         """Test async translation API error handling."""
-        import aiohttp
-        
-        with patch('aiohttp.ClientSession') as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.side_effect = aiohttp.ClientError("Connection failed")
-            
-            translator = DeepLTranslator(deepl_config)
-            result = await translator.translate_async("Hello", "en", "es")
-            
-            assert result["status"] == TranslationStatus.ERROR
-            assert "DeepL API error" in result["error"]
+        fake_aiohttp(aiohttp.ClientError("Connection failed"))
+
+        translator = DeepLTranslator(deepl_config)
+        result = await translator.translate_async("Hello", "en", "es")
+
+        assert result["status"] == TranslationStatus.ERROR
+        assert "DeepL API error" in result["error"]
 
 
 class TestAdditionalMethods:
     """Test additional utility methods."""
 
-    @patch('deepl.Translator')
-    def test_get_supported_languages_success(self, mock_deepl_client, deepl_config):
+    def test_get_supported_languages_success(self, deepl_client, deepl_config):
         """Test successful retrieval of supported languages."""
-        # Setup mock language objects
-        mock_source_lang = Mock()
-        mock_source_lang.code = "EN"
-        mock_target_lang = Mock()
-        mock_target_lang.code = "ES"
-        
-        mock_client_instance = Mock()
-        mock_client_instance.get_source_languages.return_value = [mock_source_lang]
-        mock_client_instance.get_target_languages.return_value = [mock_target_lang]
-        mock_deepl_client.return_value = mock_client_instance
+        deepl_client.get_source_languages.return_value = [_Lang("EN")]
+        deepl_client.get_target_languages.return_value = [_Lang("ES")]
         
         translator = DeepLTranslator(deepl_config)
         languages = translator.get_supported_languages()
@@ -278,12 +545,9 @@ class TestAdditionalMethods:
         assert "en" in languages["source"]
         assert "es" in languages["target"]
 
-    @patch('deepl.Translator')
-    def test_get_supported_languages_fallback(self, mock_deepl_client, deepl_config):
+    def test_get_supported_languages_fallback(self, deepl_client, deepl_config):
         """Test fallback when language retrieval fails."""
-        mock_client_instance = Mock()
-        mock_client_instance.get_source_languages.side_effect = Exception("API Error")
-        mock_deepl_client.return_value = mock_client_instance
+        deepl_client.get_source_languages.side_effect = Exception("API Error")
         
         translator = DeepLTranslator(deepl_config)
         languages = translator.get_supported_languages()
@@ -294,21 +558,11 @@ class TestAdditionalMethods:
         assert len(languages["source"]) > 0
         assert len(languages["target"]) > 0
 
-    @patch('deepl.Translator')
-    def test_get_usage_info_success(self, mock_deepl_client, deepl_config):
+    def test_get_usage_info_success(self, deepl_client, deepl_config):
         """Test successful usage info retrieval."""
-        # Setup mock usage object
-        mock_character = Mock()
-        mock_character.count = 12345
-        mock_character.limit = 500000
-        mock_character.limit_reached = False
-        
-        mock_usage = Mock()
-        mock_usage.character = mock_character
-        
-        mock_client_instance = Mock()
-        mock_client_instance.get_usage.return_value = mock_usage
-        mock_deepl_client.return_value = mock_client_instance
+        deepl_client.get_usage.return_value = SimpleNamespace(
+            character=SimpleNamespace(count=12345, limit=500000, limit_reached=False)
+        )
         
         translator = DeepLTranslator(deepl_config)
         usage = translator.get_usage_info()
@@ -317,12 +571,20 @@ class TestAdditionalMethods:
         assert usage["character_limit"] == 500000
         assert usage["character_limit_reached"] is False
 
-    @patch('deepl.Translator')
-    def test_get_usage_info_error(self, mock_deepl_client, deepl_config):
+    def test_sync_client_is_reused(self, mock_deepl, deepl_client, deepl_config):
+        """Test that the SDK client is created once and closed explicitly."""
+        translator = DeepLTranslator(deepl_config)
+
+        assert translator.client is translator.client
+        assert mock_deepl.call_count == 1
+
+        translator.close()
+        deepl_client.close.assert_called_once()
+        assert translator._client is None
+
+    def test_get_usage_info_error(self, deepl_client, deepl_config):
         """Test usage info retrieval error handling."""
-        mock_client_instance = Mock()
-        mock_client_instance.get_usage.side_effect = Exception("API Error")
-        mock_deepl_client.return_value = mock_client_instance
+        deepl_client.get_usage.side_effect = Exception("API Error")
         
         translator = DeepLTranslator(deepl_config)
         usage = translator.get_usage_info()
@@ -334,12 +596,9 @@ class TestAdditionalMethods:
 class TestErrorHandling:
     """Test comprehensive error handling scenarios."""
 
-    @patch('deepl.Translator')
-    def test_general_exception_handling(self, mock_deepl_client, deepl_config):
+    def test_general_exception_handling(self, deepl_client, deepl_config):
         """Test handling of general exceptions."""
-        mock_client_instance = Mock()
-        mock_client_instance.translate_text.side_effect = ValueError("Invalid input")
-        mock_deepl_client.return_value = mock_client_instance
+        deepl_client.translate_text.side_effect = ValueError("Invalid input")
         
         translator = DeepLTranslator(deepl_config)
         result = translator.translate("Hello", "en", "es")
@@ -353,14 +612,7 @@ class TestProviderDiscovery:
 
     def test_provider_discovery(self, deepl_config):
         """Test that the provider can be discovered."""
-        from mt_providers import get_provider
-        
-        provider_class = get_provider("deepl")
-        translator = provider_class(deepl_config)
+        translator = _provider_cls()(deepl_config)
         
         assert isinstance(translator, DeepLTranslator)
         assert translator.name == "deepl"
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])